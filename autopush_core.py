@@ -0,0 +1,670 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Auto Git Push - shared core
+---------------------------
+All helpers and the main loop live here; edition-specific entry points
+(auto_git_push.py and friends) just set env-var defaults and call main().
+
+- Always writes/updates .autopush_heartbeat.txt so there's something to commit.
+- Auto-initializes git if needed.
+- Auto-adds 'origin' if REMOTE_URL is provided.
+- Ensures upstream and pushes on every cycle.
+
+ENV (optional):
+- REPO_PATH=/absolute/path                (default: current working dir)
+- BRANCH_NAME=main                        (default: auto-detect, else 'main')
+- AUTOPUSH_INTERVAL=14400                 (seconds; default 4 hours)
+- GIT_USER_NAME="Om-1004"                 (git config --global)
+- GIT_USER_EMAIL="opatel101004@gmail.com" (git config --global)
+- REMOTE_URL="https://github.com/USER/REPO.git"  (or SSH URL)
+"""
+
+import configparser
+import functools
+import hashlib
+import os
+import shlex
+import signal
+import threading
+import time
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:  # watchdog is optional; we fall back to the interval timer
+    Observer = None
+    FileSystemEventHandler = object
+
+try:
+    import pygit2
+except ImportError:  # pygit2 is optional; we fall back to git subprocesses
+    pygit2 = None
+
+# ----------------------------
+# Config
+# ----------------------------
+# Default is now 4 hours = 14400 seconds
+SLEEP_DURATION = int(os.getenv("AUTOPUSH_INTERVAL", "14400"))
+REPO_PATH = os.path.abspath(os.getenv("REPO_PATH", os.getcwd()))
+BRANCH_NAME_ENV = os.getenv("BRANCH_NAME", "").strip() or None
+REMOTE_URL = os.getenv("REMOTE_URL", "").strip() or None
+
+GIT_USER_NAME = os.getenv("GIT_USER_NAME", "Om-1004")
+GIT_USER_EMAIL = os.getenv("GIT_USER_EMAIL", "opatel101004@gmail.com")
+
+HEARTBEAT_FILE = ".autopush_heartbeat.txt"
+
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# How long to wait after the last filesystem event before pushing, so a burst
+# of saves coalesces into one commit.
+DEBOUNCE_SECONDS = float(os.getenv("AUTOPUSH_DEBOUNCE", "5"))
+
+# Push every Nth commit (local commits are cheap; each push re-negotiates the
+# transport handshake, so batching amortizes it into one pack of N commits).
+# A time cap bounds how long a commit can sit unpushed. N=1 pushes per cycle.
+PUSH_BATCH = max(1, int(os.getenv("AUTOPUSH_PUSH_BATCH", "1")))
+PUSH_MAX_WAIT = float(os.getenv("AUTOPUSH_PUSH_MAX_WAIT", "300"))
+
+# ----------------------------
+# Helpers
+# ----------------------------
+# Fixed-shape git invocations, assembled once at import time instead of as
+# per-call list literals. Branch- and URL-bearing commands are built where
+# the runtime value lives (RepoSession precomputes the push argv).
+GIT_IS_WORK_TREE = ("git", "rev-parse", "--is-inside-work-tree")
+GIT_ABBREV_HEAD = ("git", "rev-parse", "--abbrev-ref", "HEAD")
+GIT_SYMBOLIC_REF = ("git", "symbolic-ref", "--short", "HEAD")
+GIT_REMOTE_GET_URL = ("git", "remote", "get-url", "origin")
+GIT_REMOTE_REMOVE = ("git", "remote", "remove", "origin")
+GIT_ORIGIN_URL_CONFIG = ("git", "config", "--get", "remote.origin.url")
+GIT_INIT = ("git", "init")
+GIT_ADD_ALL = ("git", "add", "-A")
+GIT_ADD_HEARTBEAT = ("git", "add", "--", HEARTBEAT_FILE)
+
+# Commands whose variable parts are process-lifetime constants (identity,
+# remote URL) are assembled here too, not re-interpolated at each call site.
+GIT_CONFIG_NAME = ("git", "config", "--global", "user.name", GIT_USER_NAME)
+GIT_CONFIG_EMAIL = ("git", "config", "--global", "user.email", GIT_USER_EMAIL)
+GIT_REMOTE_ADD = ("git", "remote", "add", "origin", REMOTE_URL) if REMOTE_URL else None
+
+# Built once and reused for every spawn. GIT_OPTIONAL_LOCKS=0 lets read-only
+# commands (rev-parse, status, ...) skip index.lock writes; GIT_TERMINAL_PROMPT=0
+# fails fast instead of hanging the daemon on a credential prompt.
+_GIT_ENV = {**os.environ, "GIT_OPTIONAL_LOCKS": "0", "GIT_TERMINAL_PROMPT": "0"}
+
+def run(argv, cwd=None, check=True, input=None):
+    """Run one git command as an argv list (no shell in between)."""
+    try:
+        r = subprocess.run(argv, cwd=cwd, text=True, capture_output=True, check=check,
+                           env=_GIT_ENV, close_fds=False, input=input)
+        return r.stdout.strip(), r.returncode == 0
+    except subprocess.CalledProcessError as e:
+        msg = (e.stdout or e.stderr or str(e)).strip()
+        return msg, False
+
+def run_batch(cmds, cwd=None):
+    """Chain several git commands into one `cmd1 && cmd2 && ...` shell call.
+
+    Multi-step sequences (init, commit+push) pay one fork/exec for the whole
+    chain instead of one per step, and leave fewer windows where a stale
+    .git/index.lock can collide with the next command.
+    """
+    script = " && ".join(" ".join(shlex.quote(a) for a in argv) for argv in cmds)
+    try:
+        r = subprocess.run(script, shell=True, cwd=cwd, text=True, capture_output=True,
+                           env=_GIT_ENV, close_fds=False)
+        return r.stdout.strip(), r.returncode == 0
+    except OSError as e:
+        return str(e), False
+
+class GitSession:
+    """One long-lived `git cat-file --batch-check` per repo.
+
+    Existence checks (does branch X exist? is there an upstream?) used to
+    fork a fresh `git rev-parse` each time. cat-file --batch-check resolves
+    the same rev syntax, so we feed it names over stdin and read one status
+    line back, paying the fork/exec cost once per daemon lifetime.
+    """
+    def __init__(self, path):
+        self.path = path
+        self._proc = None
+
+    def _ensure_proc(self):
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = subprocess.Popen(
+                ["git", "cat-file", "--batch-check"],
+                cwd=self.path, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL, text=True, env=_GIT_ENV,
+            )
+        return self._proc
+
+    def ref_exists(self, name):
+        if "@{" in name:
+            # Revs like <branch>@{upstream} make cat-file die with a fatal
+            # error instead of answering "missing" when unresolvable, which
+            # would tear down the shared process; probe them one-shot.
+            _, ok = run(["git", "rev-parse", "--verify", "--quiet", name],
+                        cwd=self.path, check=False)
+            return ok
+        try:
+            proc = self._ensure_proc()
+            proc.stdin.write(name + "\n")
+            proc.stdin.flush()
+            line = proc.stdout.readline().strip()
+        except (OSError, ValueError, BrokenPipeError):
+            self.close()
+            return False
+        return bool(line) and not line.endswith(" missing") and "ambiguous" not in line
+
+    def close(self):
+        if self._proc is not None:
+            try:
+                self._proc.stdin.close()
+                self._proc.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                self._proc.kill()
+            self._proc = None
+
+_SESSIONS = {}
+
+def get_session(path):
+    if path not in _SESSIONS:
+        _SESSIONS[path] = GitSession(path)
+    return _SESSIONS[path]
+
+# The answers to "are we a repo / which branch / which remote" live in tiny
+# text files under .git/, so read those directly and only fall back to a git
+# subprocess for the odd layouts (worktrees and submodules, where .git is a
+# file pointing elsewhere).
+
+def _read_head(path):
+    """Current branch from .git/HEAD, or None if detached or unreadable."""
+    try:
+        txt = (Path(path) / ".git" / "HEAD").read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    prefix = "ref: refs/heads/"
+    return txt[len(prefix):] if txt.startswith(prefix) else None
+
+def _read_origin_url(path):
+    """Origin URL from .git/config, or None if absent or unparseable."""
+    cp = configparser.ConfigParser()
+    try:
+        if not cp.read(Path(path) / ".git" / "config"):
+            return None
+        return cp.get('remote "origin"', "url", fallback=None)
+    except (configparser.Error, OSError):
+        return None
+
+def is_git_repo(path):
+    if (Path(path) / ".git").is_dir():
+        return True
+    out, ok = run(GIT_IS_WORK_TREE, cwd=path, check=False)
+    return ok and out.lower() == "true"
+
+_CONFIG_CHECKED = False
+
+def git_config_global():
+    """Set the global identity, spawning git only for values that differ
+    from what ~/.gitconfig already holds."""
+    global _CONFIG_CHECKED
+    if _CONFIG_CHECKED:
+        return
+    name = email = None
+    cp = configparser.ConfigParser()
+    try:
+        if cp.read(Path.home() / ".gitconfig"):
+            name = cp.get("user", "name", fallback=None)
+            email = cp.get("user", "email", fallback=None)
+    except (configparser.Error, OSError):
+        pass
+    if name != GIT_USER_NAME:
+        run(GIT_CONFIG_NAME, check=False)
+    if email != GIT_USER_EMAIL:
+        run(GIT_CONFIG_EMAIL, check=False)
+    _CONFIG_CHECKED = True
+
+def get_branch(path):
+    branch = _read_head(path)
+    if branch:
+        return branch
+    out, ok = run(GIT_ABBREV_HEAD, cwd=path, check=False)
+    if ok and out and out != "HEAD":
+        return out
+    out2, ok2 = run(GIT_SYMBOLIC_REF, cwd=path, check=False)
+    return out2 if ok2 and out2 else None
+
+def checkout_or_create_branch(path, branch):
+    if get_session(path).ref_exists(branch):
+        _, ok2 = run(["git", "checkout", branch], cwd=path, check=False)
+        return ok2
+    out, has_remote = run(["git", "ls-remote", "--heads", "origin", branch], cwd=path, check=False)
+    if has_remote and out:
+        _, ok3 = run(["git", "checkout", "-b", branch, "--track", f"origin/{branch}"], cwd=path, check=False)
+        return ok3
+    _, ok4 = run(["git", "checkout", "-b", branch], cwd=path, check=False)
+    return ok4
+
+def ensure_repo(path, branch_fallback="main"):
+    if not is_git_repo(path):
+        print(f"Git not found in {path}. Initializing...")
+        out, ok = run_batch([
+            GIT_INIT,
+            GIT_ADD_ALL,
+            ["git", "commit", "-m", "Initial commit", "--allow-empty"],
+        ], cwd=path)
+        if not ok:
+            print("Failed to init git:", out)
+            return False
+    branch = get_branch(path) or branch_fallback
+    checkout_or_create_branch(path, branch)
+    return True
+
+def ensure_origin(path):
+    if _read_origin_url(path):
+        return True
+    out, ok = run(GIT_REMOTE_GET_URL, cwd=path, check=False)
+    if ok and out:
+        return True
+    if not REMOTE_URL:
+        print("No 'origin' remote and REMOTE_URL not set. Set REMOTE_URL to add remote automatically.")
+        return False
+    print(f"Adding origin -> {REMOTE_URL}")
+    run(GIT_REMOTE_REMOVE, cwd=path, check=False)
+    out, ok = run(GIT_REMOTE_ADD, cwd=path, check=False)
+    if not ok:
+        print("Failed to add origin:", out)
+        return False
+    return True
+
+def ensure_upstream(path, branch):
+    if get_session(path).ref_exists(f"{branch}@{{upstream}}"):
+        return True
+    _, push_ok = run(["git", "push", "-u", "origin", branch], cwd=path, check=False)
+    return push_ok
+
+# File descriptor for the heartbeat file, opened once in main() so each
+# heartbeat is a single write() syscall instead of an open/write/close trio.
+_HEARTBEAT_FD = None
+_HEARTBEAT_WRITES = 0
+
+# fsync the heartbeat every N writes; durability of individual heartbeats is
+# not critical (the next cycle rewrites one anyway). 0 disables fsync.
+FSYNC_EVERY = max(0, int(os.getenv("AUTOPUSH_FSYNC_EVERY", "10")))
+
+def open_heartbeat(path):
+    global _HEARTBEAT_FD
+    p = str(Path(path) / HEARTBEAT_FILE)
+    _HEARTBEAT_FD = os.open(p, os.O_WRONLY | os.O_CREAT, 0o644)
+
+def heartbeat(path, now_str=None):
+    global _HEARTBEAT_WRITES
+    if _HEARTBEAT_FD is None:
+        open_heartbeat(path)
+    if now_str is None:
+        now_str = time.strftime(TIME_FORMAT)
+    payload = f"[auto-push heartbeat] {now_str}\n".encode("utf-8")
+    # Overwrite the single line in place: the payload only has to *differ*
+    # from last cycle, not accumulate, so the committed blob stays tiny.
+    os.pwrite(_HEARTBEAT_FD, payload, 0)
+    os.ftruncate(_HEARTBEAT_FD, len(payload))
+    _HEARTBEAT_WRITES += 1
+    if FSYNC_EVERY and _HEARTBEAT_WRITES % FSYNC_EVERY == 0:
+        os.fsync(_HEARTBEAT_FD)
+    return payload
+
+# ----------------------------
+# Push-skip state
+# ----------------------------
+# Digest of the heartbeat payload at the last push, kept in memory and
+# persisted under ~/.cache/autopush/ so a restarted daemon does not re-push
+# an unchanged tree.
+_STATE_DIR = Path.home() / ".cache" / "autopush"
+
+def _state_file(path):
+    repo_id = hashlib.blake2b(str(path).encode("utf-8"), digest_size=8).hexdigest()
+    return _STATE_DIR / f"{repo_id}.state"
+
+def load_pushed_digest(path):
+    try:
+        return _state_file(path).read_text(encoding="utf-8").strip() or None
+    except OSError:
+        return None
+
+def save_pushed_digest(path, digest):
+    try:
+        _STATE_DIR.mkdir(parents=True, exist_ok=True)
+        _state_file(path).write_text(digest, encoding="utf-8")
+    except OSError:
+        pass  # skip-state is an optimization; losing it just means one extra push
+
+def payload_digest(payload):
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+def worktree_clean(path):
+    # Exit-code-only probe: no status formatting, no output to parse.
+    _, clean = run(["git", "diff", "--quiet"], cwd=path, check=False)
+    return clean
+
+# Single worker so two pushes can never race on the same branch; the push of
+# one cycle overlaps the wait + heartbeat + commit of the next.
+_PUSH_POOL = ThreadPoolExecutor(max_workers=1)
+_PUSH_FUTURE = None
+
+# Push-batching state: commits accumulated since the last submitted push, and
+# when that push was submitted.
+_COMMITS_SINCE_PUSH = 0
+_LAST_PUSH_TS = 0.0
+_LAST_PUSH_OK = True
+
+def _push(repo):
+    # The push is the single hottest spawn and we only consume its exit
+    # status, so posix_spawnp skips subprocess's Popen machinery (pipe
+    # creation, fd bookkeeping, output decoding) where it exists.
+    if hasattr(os, "posix_spawnp"):
+        try:
+            pid = os.posix_spawnp(
+                "git", list(repo.push_cmd), _GIT_ENV,
+                file_actions=[
+                    (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0o644),
+                    (os.POSIX_SPAWN_DUP2, 1, 2),
+                ],
+            )
+            return os.waitstatus_to_exitcode(os.waitpid(pid, 0)[1]) == 0
+        except OSError:
+            pass  # fall through to the portable path
+    _, push_ok = run(repo.push_cmd, cwd=repo.path, check=False)
+    return push_ok
+
+def low_level_commit(path, branch, payload, msg):
+    """Commit a heartbeat-only change with plumbing, bypassing the index.
+
+    The new tree differs from HEAD by exactly one blob, so write that blob
+    (hash-object), splice it into HEAD's tree listing (mktree), wrap it in a
+    commit (commit-tree) and advance the branch ref (update-ref). No workdir
+    scan, no index rewrite. Returns False on any failure so the caller can
+    fall back to the porcelain path.
+    """
+    blob, ok = run(["git", "hash-object", "-w", "--stdin"], cwd=path, check=False,
+                   input=payload.decode("utf-8"))
+    if not ok or not blob:
+        return False
+    tree_txt, ok = run(["git", "cat-file", "-p", "HEAD^{tree}"], cwd=path, check=False)
+    if not ok:
+        return False
+    lines = [l for l in tree_txt.splitlines() if not l.endswith("\t" + HEARTBEAT_FILE)]
+    lines.append(f"100644 blob {blob}\t{HEARTBEAT_FILE}")
+    tree, ok = run(["git", "mktree"], cwd=path, check=False,
+                   input="\n".join(lines) + "\n")
+    if not ok or not tree:
+        return False
+    commit, ok = run(["git", "commit-tree", tree, "-p", "HEAD", "-m", msg],
+                     cwd=path, check=False)
+    if not ok or not commit:
+        return False
+    _, ok = run(["git", "update-ref", f"refs/heads/{branch}", commit], cwd=path, check=False)
+    if not ok:
+        return False
+    # Point the index at the new blob too; otherwise it keeps the pre-commit
+    # entry and git status/diff report a phantom modification forever.
+    _, ok = run(["git", "update-index", "--cacheinfo",
+                 f"100644,{blob},{HEARTBEAT_FILE}"], cwd=path, check=False)
+    return ok
+
+# libgit2 repo handles, one per path, opened lazily (mirrors _SESSIONS).
+_PYGIT2_REPOS = {}
+
+def _pygit2_commit(path, msg, full_scan):
+    """Stage and commit in-process via libgit2; returns False so the caller
+    can fall back to the subprocess path on any error."""
+    try:
+        repo = _PYGIT2_REPOS.get(path)
+        if repo is None:
+            repo = _PYGIT2_REPOS[path] = pygit2.Repository(path)
+        index = repo.index
+        if full_scan:
+            index.add_all()
+        else:
+            index.add(HEARTBEAT_FILE)
+        index.write()
+        tree = index.write_tree()
+        sig = pygit2.Signature(GIT_USER_NAME, GIT_USER_EMAIL)
+        parents = [] if repo.head_is_unborn else [repo.head.target]
+        repo.create_commit("HEAD", sig, sig, msg, tree, parents)
+        return True
+    except (pygit2.GitError, KeyError, OSError):
+        return False
+
+def commit_and_push(repo, full_scan=True, now_str=None, payload=None):
+    """Commit locally, then hand the push to the background worker.
+
+    Returns the result of the *previous* cycle's push (True on the first
+    cycle); the current push completes while the loop is waiting. If a push
+    stalls, later commits accumulate locally and ride along in one pack on
+    the next push of the branch head.
+    """
+    global _PUSH_FUTURE
+    # On heartbeat-only cycles the changed set is known to be exactly the
+    # heartbeat file, so stage just that path and skip the O(tree) workdir
+    # scan that `git add -A` does. Watcher-triggered cycles still scan.
+    if full_scan:
+        add = GIT_ADD_ALL
+    else:
+        add = GIT_ADD_HEARTBEAT
+    if now_str is None:
+        now_str = time.strftime(TIME_FORMAT)
+    msg = f"Auto-commit: {now_str}"
+    committed = pygit2 is not None and _pygit2_commit(repo.path, msg, full_scan)
+    if not committed and not full_scan and payload is not None:
+        # Heartbeat-only change with known content: plumbing commit avoids
+        # both the workdir scan and the index rewrite.
+        committed = low_level_commit(repo.path, repo.branch, payload, msg)
+    if not committed:
+        run_batch([
+            add,
+            ["git", "commit", "-m", msg, "--allow-empty"],
+        ], cwd=repo.path)
+    global _COMMITS_SINCE_PUSH, _LAST_PUSH_TS, _LAST_PUSH_OK
+    _COMMITS_SINCE_PUSH += 1
+    push_due = (_COMMITS_SINCE_PUSH >= PUSH_BATCH
+                or time.monotonic() - _LAST_PUSH_TS >= PUSH_MAX_WAIT)
+    if not push_due:
+        return _LAST_PUSH_OK
+    if _PUSH_FUTURE is not None:
+        _LAST_PUSH_OK = _PUSH_FUTURE.result()
+    _PUSH_FUTURE = _PUSH_POOL.submit(_push, repo)
+    _COMMITS_SINCE_PUSH = 0
+    _LAST_PUSH_TS = time.monotonic()
+    return _LAST_PUSH_OK
+
+def flush_push(repo=None):
+    """Wait for the in-flight push and send any still-unpushed commits."""
+    if _PUSH_FUTURE is not None:
+        _PUSH_FUTURE.result()
+    if repo is not None and _COMMITS_SINCE_PUSH:
+        _push(repo)
+
+@functools.lru_cache(maxsize=None)
+def get_repo_url(path):
+    url = _read_origin_url(path)
+    if url:
+        return url
+    out, ok = run(GIT_ORIGIN_URL_CONFIG, cwd=path, check=False)
+    return out if (ok and out) else "Unknown"
+
+@dataclass
+class RepoSession:
+    """Repo metadata resolved once at startup.
+
+    Branch, remote URL and upstream state never change underneath a running
+    daemon, so the loop reads them from here instead of re-spawning git.
+    """
+    path: str
+    branch: str
+    remote_url: str
+    upstream_ok: bool
+
+    def __post_init__(self):
+        # The steady-state push argv, specialized once for this branch.
+        # -C carries the repo path because posix_spawn has no cwd parameter.
+        self.push_cmd = ("git", "-C", self.path, "push", "origin", self.branch)
+
+# ----------------------------
+# Change watching
+# ----------------------------
+# Set when debounced filesystem activity (or the interval timer) says it is
+# time for the next commit+push cycle.
+_WAKE = threading.Event()
+
+class _RepoChangeHandler(FileSystemEventHandler):
+    """Coalesces filesystem events into one wake-up per burst."""
+
+    def __init__(self):
+        self._timer = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _ignored(path):
+        # .git itself also gets DirModifiedEvents (index.lock, refs, ...)
+        # whenever we commit; reacting to those would self-trigger forever.
+        return (not path
+                or f"{os.sep}.git{os.sep}" in path
+                or path.endswith(f"{os.sep}.git")
+                or path.endswith(HEARTBEAT_FILE))
+
+    def on_any_event(self, event):
+        src = getattr(event, "src_path", "") or ""
+        dest = getattr(event, "dest_path", "") or ""
+        if self._ignored(src) and (not dest or self._ignored(dest)):
+            return
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(DEBOUNCE_SECONDS, _WAKE.set)
+            self._timer.daemon = True
+            self._timer.start()
+
+def _on_wake_signal(signum, frame):
+    _WAKE.set()
+
+def install_signal_handlers():
+    """`kill -USR1 <pid>` (or -HUP) forces an immediate cycle instead of
+    waiting out the interval; no-op on platforms without these signals."""
+    for name in ("SIGUSR1", "SIGHUP"):
+        sig = getattr(signal, name, None)
+        if sig is not None:
+            try:
+                signal.signal(sig, _on_wake_signal)
+            except (ValueError, OSError):
+                pass  # not the main thread, or signal unsupported here
+
+def start_watcher(path):
+    """Watch the repo for changes; returns the observer, or None if watchdog
+    is unavailable (the loop then falls back to pure interval polling)."""
+    if Observer is None:
+        return None
+    observer = Observer()
+    observer.schedule(_RepoChangeHandler(), path, recursive=True)
+    observer.daemon = True
+    observer.start()
+    return observer
+
+# ----------------------------
+# Main
+# ----------------------------
+def main():
+    print("Starting auto-push script (heartbeat mode, 4-hour interval)...")
+    print(f"Local path: {REPO_PATH}")
+    if not os.path.isdir(REPO_PATH):
+        print(f"Error: Path does not exist: {REPO_PATH}")
+        return
+
+    # Independent startup probes run in parallel; steps with real ordering
+    # dependencies (identity before the init commit, origin before upstream)
+    # stay serial below.
+    with ThreadPoolExecutor(max_workers=4) as probes:
+        config_future = probes.submit(git_config_global)
+        is_repo_future = probes.submit(is_git_repo, REPO_PATH)
+        branch_future = probes.submit(get_branch, REPO_PATH)
+        if not is_repo_future.result():
+            config_future.result()  # the init commit needs user identity set
+        if not ensure_repo(REPO_PATH):
+            return
+        detected_branch = branch_future.result()
+        config_future.result()
+
+    branch = BRANCH_NAME_ENV or detected_branch or get_branch(REPO_PATH) or "main"
+    if BRANCH_NAME_ENV:
+        checkout_or_create_branch(REPO_PATH, BRANCH_NAME_ENV)
+        branch = get_branch(REPO_PATH) or branch
+    # Open after branch selection: checkout replaces changed files by inode,
+    # which would strand an fd opened against the pre-checkout heartbeat.
+    open_heartbeat(REPO_PATH)
+
+    if not ensure_origin(REPO_PATH):
+        print("Tip: export REMOTE_URL=https://github.com/USER/REPO.git")
+    upstream_ok = ensure_upstream(REPO_PATH, branch)
+    if not upstream_ok:
+        print(f"Warning: could not set upstream for '{branch}'. Check credentials/remote.")
+
+    repo = RepoSession(
+        path=REPO_PATH,
+        branch=branch,
+        remote_url=get_repo_url(REPO_PATH),
+        upstream_ok=upstream_ok,
+    )
+
+    print(f"Repository: {repo.remote_url}")
+    print(f"Branch: {repo.branch}")
+    print(f"Interval: {SLEEP_DURATION} seconds ({SLEEP_DURATION/3600:.1f} hours)")
+    observer = start_watcher(REPO_PATH)
+    if observer is not None:
+        print(f"Watching for changes (debounce {DEBOUNCE_SECONDS:.0f}s); interval acts as heartbeat fallback.")
+    install_signal_handlers()
+    print(f"Send SIGUSR1 to pid {os.getpid()} for an immediate push.")
+    print("Press Ctrl+C to stop.\n")
+
+    try:
+        # First cycle scans everything; afterwards only watcher wake-ups do.
+        full_scan = True
+        pushed_digest = load_pushed_digest(REPO_PATH)
+        while True:
+            # One timestamp per cycle, shared by the log line, heartbeat
+            # payload and commit message. time.strftime stays at the C level
+            # instead of building a datetime object first.
+            now_str = time.strftime(TIME_FORMAT)
+            payload = heartbeat(REPO_PATH, now_str)
+            digest = payload_digest(payload)
+            if (not full_scan and digest == pushed_digest
+                    and worktree_clean(REPO_PATH)):
+                print(f"{now_str}: No changes since last push; skipping.")
+            else:
+                print(f"{now_str}: Writing heartbeat, committing, pushing...")
+                if commit_and_push(repo, full_scan=full_scan, now_str=now_str,
+                                   payload=payload):
+                    print("✓ Committed; push running in background.")
+                else:
+                    print("✗ Previous push failed (check remote/credentials).")
+                pushed_digest = digest
+                save_pushed_digest(REPO_PATH, digest)
+            print(f"Waiting up to {SLEEP_DURATION}s for changes...\n")
+            # Without a watcher nothing reports edits, so every timer cycle
+            # must scan the whole tree like the pure-interval version did.
+            full_scan = _WAKE.wait(timeout=SLEEP_DURATION) or observer is None
+            _WAKE.clear()
+    except KeyboardInterrupt:
+        print("\nStopping auto-push script...")
+    finally:
+        if observer is not None:
+            observer.stop()
+        flush_push(repo)
+
+if __name__ == "__main__":
+    main()